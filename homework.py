@@ -1,26 +1,37 @@
-from dataclasses import dataclass, asdict
+from collections.abc import Iterable, Mapping, Sequence
+from itertools import repeat
+from types import MappingProxyType
 
 
-@dataclass
 class InfoMessage:
     """Training information message."""
 
-    training_type: str
-    duration: float
-    distance: float
-    speed: float
-    calories: float
+    __slots__ = ('training_type', 'duration', 'distance', 'speed', 'calories')
 
-    _message: str = ('Тип тренировки: {training_type}; '
-                     'Длительность: {duration:.3f} ч.; '
-                     'Дистанция: {distance:.3f} км; '
-                     'Ср. скорость: {speed:.3f} км/ч; '
-                     'Потрачено ккал: {calories:.3f}.')
+    MESSAGE: str = ('Тип тренировки: %s; '
+                    'Длительность: %.3f ч.; '
+                    'Дистанция: %.3f км; '
+                    'Ср. скорость: %.3f км/ч; '
+                    'Потрачено ккал: %.3f.')
+
+    def __init__(self,
+                 training_type: str,
+                 duration: float,
+                 distance: float,
+                 speed: float,
+                 calories: float
+                 ) -> None:
+        self.training_type = training_type
+        self.duration = duration
+        self.distance = distance
+        self.speed = speed
+        self.calories = calories
 
     def get_message(self) -> str:
         """Get info message about training."""
 
-        return self._message.format(**asdict(self))
+        return self.MESSAGE % (self.training_type, self.duration,
+                               self.distance, self.speed, self.calories)
 
 
 class Training:
@@ -29,6 +40,22 @@ class Training:
     LEN_STEP: float = 0.65
     M_IN_KM: int = 1000
     MIN_IN_HOUR: int = 60
+    KM_PER_STEP: float = LEN_STEP / M_IN_KM
+    TRAINING_TYPE: str = 'Training'
+    FIELDS: tuple[str, ...] = ('action', 'duration', 'weight')
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Derive per-class constants from the subclass definition."""
+
+        super().__init_subclass__(**kwargs)
+        cls.KM_PER_STEP = cls.LEN_STEP / cls.M_IN_KM
+        if 'TRAINING_TYPE' not in cls.__dict__:
+            cls.TRAINING_TYPE = cls.__name__
+        cls._fold_constants()
+
+    @classmethod
+    def _fold_constants(cls) -> None:
+        """Precompute formula coefficients from the class constants."""
 
     def __init__(self,
                  action: int,
@@ -58,25 +85,101 @@ class Training:
     def show_training_info(self) -> InfoMessage:
         """Return an info message about the completed training."""
 
-        return InfoMessage(type(self).__name__, self.duration,
+        return InfoMessage(self.TRAINING_TYPE, self.duration,
                            self.get_distance(), self.get_mean_speed(),
                            self.get_spent_calories())
 
+    def describe(self) -> str:
+        """Get info message about the completed training."""
+
+        return InfoMessage.MESSAGE % (self.TRAINING_TYPE, self.duration,
+                                      self.get_distance(),
+                                      self.get_mean_speed(),
+                                      self.get_spent_calories())
+
+    @classmethod
+    def distance_batch(cls, action: Sequence[int]) -> list[float]:
+        """Get distances in km for a batch of trainings."""
+
+        return [steps * cls.LEN_STEP / cls.M_IN_KM for steps in action]
+
+    @classmethod
+    def mean_speed_batch(cls,
+                         distance: Sequence[float],
+                         columns: Mapping[str, Sequence[float]]
+                         ) -> list[float]:
+        """Get average moving speeds for a batch of trainings.
+
+        Takes the already computed distances and the batch columns
+        keyed by constructor argument name.
+        """
+
+        return [km / hours for km, hours in zip(distance, columns['duration'])]
+
+    @classmethod
+    def calories_batch(cls,
+                       columns: Mapping[str, Sequence[float]]
+                       ) -> list[float]:
+        """Get spent calories amounts for a batch of trainings."""
+
+        raise NotImplementedError
+
+    @classmethod
+    def describe_batch(cls, *columns: Sequence[float]) -> list[str]:
+        """Get info messages for a batch of trainings of one type.
+
+        Every column holds one constructor argument for all the trainings,
+        in the order the constructor takes them. Raises ValueError when
+        the number of columns or their lengths do not match.
+        """
+
+        _count_rows(columns)
+        fields: dict[str, Sequence[float]] = dict(
+            zip(cls.FIELDS, columns, strict=True))
+        distance: list[float] = cls.distance_batch(fields['action'])
+        speed: list[float] = cls.mean_speed_batch(distance, fields)
+        calories: list[float] = cls.calories_batch(fields)
+        return [InfoMessage.MESSAGE % (cls.TRAINING_TYPE, *values)
+                for values in zip(fields['duration'], distance, speed,
+                                  calories)]
+
 
 class Running(Training):
     """Training: running."""
 
     CALORIES_MEAN_SPEED_MULTIPLIER: int = 18
     CALORIES_MEAN_SPEED_SHIFT: int = 1.79
+    CALORIES_ACTION_COEFFICIENT: float
+    CALORIES_DURATION_COEFFICIENT: float
+
+    @classmethod
+    def _fold_constants(cls) -> None:
+        """Precompute the calorie formula coefficients for running."""
+
+        cls.CALORIES_ACTION_COEFFICIENT = (
+            cls.CALORIES_MEAN_SPEED_MULTIPLIER * cls.KM_PER_STEP
+            * cls.MIN_IN_HOUR / cls.M_IN_KM)
+        cls.CALORIES_DURATION_COEFFICIENT = (
+            cls.CALORIES_MEAN_SPEED_SHIFT * cls.MIN_IN_HOUR / cls.M_IN_KM)
 
     def get_spent_calories(self) -> float:
         """Get amount of spent calories for running."""
 
-        mean_speed: float = self.get_mean_speed()
-        duration_in_minutes: float = self.duration * self.MIN_IN_HOUR
-        return ((self.CALORIES_MEAN_SPEED_MULTIPLIER * mean_speed
-                 + self.CALORIES_MEAN_SPEED_SHIFT) * self.weight
-                / self.M_IN_KM * duration_in_minutes)
+        return _running_calories(self.action, self.duration, self.weight,
+                                 self.CALORIES_ACTION_COEFFICIENT,
+                                 self.CALORIES_DURATION_COEFFICIENT)
+
+    @classmethod
+    def calories_batch(cls,
+                       columns: Mapping[str, Sequence[float]]
+                       ) -> list[float]:
+        """Get spent calories amounts for a batch of runs."""
+
+        return list(map(_running_calories,
+                        columns['action'], columns['duration'],
+                        columns['weight'],
+                        repeat(cls.CALORIES_ACTION_COEFFICIENT),
+                        repeat(cls.CALORIES_DURATION_COEFFICIENT)))
 
 
 class SportsWalking(Training):
@@ -86,6 +189,9 @@ class SportsWalking(Training):
     SPEED_HEIGHT_SHIFT: float = 0.035
     SPEED_HEIGHT_MULTIPLIER: float = 0.029
     CM_IN_M: int = 100
+    FIELDS: tuple[str, ...] = Training.FIELDS + ('height',)
+    CALORIES_ACTION_COEFFICIENT: float
+    CALORIES_DURATION_COEFFICIENT: float
 
     def __init__(self,
                  action: int,
@@ -96,16 +202,35 @@ class SportsWalking(Training):
         super().__init__(action, duration, weight)
         self.height = height
 
+    @classmethod
+    def _fold_constants(cls) -> None:
+        """Precompute the calorie formula coefficients for sport walking."""
+
+        cls.CALORIES_ACTION_COEFFICIENT = (
+            cls.SPEED_HEIGHT_MULTIPLIER * cls.KMH_IN_MS ** 2 * cls.CM_IN_M
+            * cls.MIN_IN_HOUR * cls.KM_PER_STEP ** 2)
+        cls.CALORIES_DURATION_COEFFICIENT = (
+            cls.SPEED_HEIGHT_SHIFT * cls.MIN_IN_HOUR)
+
     def get_spent_calories(self) -> float:
         """Get amount of spent calories for sport walking."""
 
-        mean_speed_in_ms: float = self.get_mean_speed() * self.KMH_IN_MS
-        duration_in_minutes: float = self.duration * self.MIN_IN_HOUR
-        height_in_m: float = self.height / self.CM_IN_M
+        return _walking_calories(self.action, self.duration,
+                                 self.weight, self.height,
+                                 self.CALORIES_ACTION_COEFFICIENT,
+                                 self.CALORIES_DURATION_COEFFICIENT)
+
+    @classmethod
+    def calories_batch(cls,
+                       columns: Mapping[str, Sequence[float]]
+                       ) -> list[float]:
+        """Get spent calories amounts for a batch of sport walks."""
 
-        return (self.weight * duration_in_minutes
-                * (self.SPEED_HEIGHT_SHIFT + self.SPEED_HEIGHT_MULTIPLIER
-                   * (mean_speed_in_ms ** 2 / height_in_m)))
+        return list(map(_walking_calories,
+                        columns['action'], columns['duration'],
+                        columns['weight'], columns['height'],
+                        repeat(cls.CALORIES_ACTION_COEFFICIENT),
+                        repeat(cls.CALORIES_DURATION_COEFFICIENT)))
 
 
 class Swimming(Training):
@@ -114,6 +239,9 @@ class Swimming(Training):
     LEN_STEP: float = 1.38
     SPEED_MODIFIER: float = 1.1
     MULTIPLIER: int = 2
+    FIELDS: tuple[str, ...] = Training.FIELDS + ('length_pool', 'count_pool')
+    CALORIES_POOL_COEFFICIENT: float
+    CALORIES_DURATION_COEFFICIENT: float
 
     def __init__(self,
                  action: int,
@@ -126,11 +254,21 @@ class Swimming(Training):
         self.length_pool = length_pool
         self.count_pool = count_pool
 
+    @classmethod
+    def _fold_constants(cls) -> None:
+        """Precompute the calorie formula coefficients for swimming."""
+
+        cls.CALORIES_POOL_COEFFICIENT = cls.MULTIPLIER / cls.M_IN_KM
+        cls.CALORIES_DURATION_COEFFICIENT = (
+            cls.SPEED_MODIFIER * cls.MULTIPLIER)
+
     def get_spent_calories(self) -> float:
         """Get amount of spent calories for swimming."""
 
-        return ((self.get_mean_speed() + self.SPEED_MODIFIER)
-                * self.MULTIPLIER * self.weight * self.duration)
+        return _swimming_calories(self.duration, self.weight,
+                                  self.length_pool, self.count_pool,
+                                  self.CALORIES_POOL_COEFFICIENT,
+                                  self.CALORIES_DURATION_COEFFICIENT)
 
     def get_mean_speed(self) -> float:
         """Get average swimming speed."""
@@ -138,36 +276,166 @@ class Swimming(Training):
         return (self.length_pool * self.count_pool
                 / self.M_IN_KM / self.duration)
 
+    @classmethod
+    def mean_speed_batch(cls,
+                         distance: Sequence[float],
+                         columns: Mapping[str, Sequence[float]]
+                         ) -> list[float]:
+        """Get average swimming speeds for a batch of swims.
+
+        Swimming speed comes from the pool size, not the stroke distance.
+        """
+
+        return [length * count / cls.M_IN_KM / hours for length, count, hours
+                in zip(columns['length_pool'], columns['count_pool'],
+                       columns['duration'])]
+
+    @classmethod
+    def calories_batch(cls,
+                       columns: Mapping[str, Sequence[float]]
+                       ) -> list[float]:
+        """Get spent calories amounts for a batch of swims."""
+
+        return list(map(_swimming_calories,
+                        columns['duration'], columns['weight'],
+                        columns['length_pool'], columns['count_pool'],
+                        repeat(cls.CALORIES_POOL_COEFFICIENT),
+                        repeat(cls.CALORIES_DURATION_COEFFICIENT)))
 
-def read_package(workout_type: str, data: list) -> Training:
+
+def _running_calories(action: int,
+                      duration: float,
+                      weight: float,
+                      action_coefficient: float,
+                      duration_coefficient: float
+                      ) -> float:
+    """Get amount of spent calories for one run."""
+
+    return (action_coefficient * action
+            + duration_coefficient * duration) * weight
+
+
+def _walking_calories(action: int,
+                      duration: float,
+                      weight: float,
+                      height: int,
+                      action_coefficient: float,
+                      duration_coefficient: float
+                      ) -> float:
+    """Get amount of spent calories for one sport walk."""
+
+    return (weight
+            * (duration_coefficient * duration
+               + action_coefficient * action * action / (duration * height)))
+
+
+def _swimming_calories(duration: float,
+                       weight: float,
+                       length_pool: int,
+                       count_pool: int,
+                       pool_coefficient: float,
+                       duration_coefficient: float
+                       ) -> float:
+    """Get amount of spent calories for one swim."""
+
+    return (pool_coefficient * length_pool * count_pool
+            + duration_coefficient * duration) * weight
+
+
+TRAINING_TYPES: Mapping[str, type[Training]] = MappingProxyType({
+    'SWM': Swimming,
+    'RUN': Running,
+    'WLK': SportsWalking
+})
+UNKNOWN_TRAINING_MESSAGE: str = 'Передан неизвестный тип тренировки.'
+
+
+class _UnknownTraining:
+    """Training of a workout type that is not supported."""
+
+    def __init__(self, *data: float) -> None:
+        """Accept sensor data of any shape and ignore it."""
+
+    def describe(self) -> str:
+        """Get a message about the unknown workout type."""
+
+        return UNKNOWN_TRAINING_MESSAGE
+
+
+def read_package(workout_type: str,
+                 data: list
+                 ) -> Training | _UnknownTraining:
     """Read data received from sensors."""
 
-    training_types: dict[str: Training] = {
-        'SWM': Swimming,
-        'RUN': Running,
-        'WLK': SportsWalking
-    }
-    if workout_type in training_types:
-        return training_types[workout_type](*data)
+    return TRAINING_TYPES.get(workout_type, _UnknownTraining)(*data)
+
+
+def _count_rows(columns: Sequence[Sequence[float]]) -> int:
+    """Get the number of trainings in a batch of equal-length columns."""
+
+    lengths: set[int] = {len(column) for column in columns}
+    if len(lengths) > 1:
+        raise ValueError('Batch columns differ in length.')
+    return lengths.pop() if lengths else 0
+
+
+def process_batches(batches: dict[str, Sequence[Sequence[float]]]
+                    ) -> list[str]:
+    """Get info messages for sensor data grouped by workout type.
+
+    Every batch holds one column per constructor argument of the workout
+    class, each column listing that argument for all the trainings.
+    A batch without columns holds no trainings. Raises ValueError when
+    the columns of a batch differ in length.
+    """
+
+    messages: list[str] = []
+    for workout_type, columns in batches.items():
+        training_type: type[Training] | None = TRAINING_TYPES.get(
+            workout_type)
+        if training_type is None:
+            messages.extend([UNKNOWN_TRAINING_MESSAGE] * _count_rows(columns))
+            continue
+        messages.extend(training_type.describe_batch(*columns))
+    return messages
 
 
-def main(training: Training) -> None:
+def process_packages(packages: Iterable[tuple[str, list]]) -> list[str]:
+    """Get info messages for a batch of packages received from sensors.
+
+    Packages are grouped by workout type and every group is processed
+    at once, so messages follow the order in which workout types first
+    appear rather than the order of the packages. Raises ValueError
+    when packages of one workout type differ in length.
+    """
+
+    rows_by_type: dict[str, list[list]] = {}
+    for workout_type, data in packages:
+        rows_by_type.setdefault(workout_type, []).append(data)
+
+    messages: list[str] = []
+    for workout_type, rows in rows_by_type.items():
+        training_type: type[Training] | None = TRAINING_TYPES.get(
+            workout_type)
+        if training_type is None:
+            messages.extend([UNKNOWN_TRAINING_MESSAGE] * len(rows))
+            continue
+        messages.extend(
+            training_type.describe_batch(*zip(*rows, strict=True)))
+    return messages
+
+
+def main(training: Training | _UnknownTraining) -> None:
     """Main function."""
 
-    info: InfoMessage = training.show_training_info()
-    print(info.get_message())
+    print(training.describe())
 
 
 if __name__ == '__main__':
-    packages: list[tuple[str, list[int]]] = [
-        ('SWM', [720, 1, 80, 25, 40]),
-        ('RUN', [15000, 1, 75]),
-        ('WLK', [9000, 1, 75, 180]),
-    ]
+    batches: dict[str, list[list[float]]] = {
+        'SWM': [[720], [1], [80], [25], [40]],
+        'RUN': [[15000], [1], [75]],
+        'WLK': [[9000], [1], [75], [180]],
+    }
 
-    for workout_type, data in packages:
-        training: Training = read_package(workout_type, data)
-        if training is not None:
-            main(training)
-        else:
-            print('Передан неизвестный тип тренировки.')
+    print('\n'.join(process_batches(batches)))
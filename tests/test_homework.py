@@ -1,4 +1,5 @@
 import re
+import random
 import pytest
 import types
 import inspect
@@ -451,3 +452,170 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+@pytest.mark.parametrize('training_type, rows', [
+    ('Swimming', [[720, 1, 80, 25, 40], [1206, 12, 6, 12, 6]]),
+    ('Running', [[15000, 1, 75], [420, 4, 20]]),
+    ('SportsWalking', [[9000, 1.5, 75, 180], [3000.33, 2.512, 75.8, 180.1]]),
+])
+def test_describe_batch(training_type, rows):
+    training_class = getattr(homework, training_type)
+    result = training_class.describe_batch(*zip(*rows))
+    expected = [training_class(*row).describe() for row in rows]
+    assert result == expected, (
+        f'Метод `describe_batch` класса `{training_type}` должен '
+        'возвращать те же сообщения, что и `describe` '
+        'для каждой тренировки.'
+    )
+
+
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+])
+def test_Training_describe(input_data):
+    training = homework.read_package(*input_data)
+    assert hasattr(training, 'describe'), (
+        'Создайте метод `describe` в классе `Training`.'
+    )
+    assert training.describe() == (
+        training.show_training_info().get_message()
+    ), (
+        'Метод `describe` должен возвращать ту же строку, что и '
+        '`get_message` у объекта из `show_training_info`.'
+    )
+
+
+def test_process_packages():
+    assert hasattr(homework, 'process_packages'), (
+        'Создайте функцию `process_packages` для обработки пачки пакетов.'
+    )
+    packages = [
+        ('WLK', [9000, 1, 75, 180]),
+        ('RUN', [1206, 12, 6]),
+        ('XYZ', [1, 2, 3]),
+        ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+    ]
+    expected = [
+        homework.read_package(*packages[0]).describe(),
+        homework.read_package(*packages[3]).describe(),
+        homework.read_package(*packages[1]).describe(),
+        'Передан неизвестный тип тренировки.',
+    ]
+    assert homework.process_packages(packages) == expected, (
+        'Функция `process_packages` должна возвращать сообщения '
+        'для всех пакетов, сгруппированные по типу тренировки.'
+    )
+
+
+def test_main_unknown_workout_type():
+    with Capturing() as get_message_output:
+        training = homework.read_package('XYZ', [9000, 1, 75])
+        homework.main(training)
+    assert get_message_output == ['Передан неизвестный тип тренировки.'], (
+        'Для неизвестного кода тренировки `main` должна печатать '
+        'сообщение о неизвестном типе тренировки.'
+    )
+
+
+def test_process_packages_ragged_rows():
+    packages = [('RUN', [15000, 1, 75, 99]), ('RUN', [15000, 1, 75])]
+    with pytest.raises(ValueError):
+        homework.process_packages(packages)
+
+
+def test_Swimming_km_per_step():
+    assert homework.Swimming.KM_PER_STEP == (
+        homework.Swimming.LEN_STEP / homework.Swimming.M_IN_KM
+    ), (
+        'Константа `KM_PER_STEP` должна вычисляться из `LEN_STEP` '
+        'класса тренировки.'
+    )
+
+
+def test_process_packages_unknown_type_without_data():
+    assert homework.process_packages([('XYZ', [])]) == [
+        'Передан неизвестный тип тренировки.'
+    ], (
+        'Функция `process_packages` должна возвращать сообщение о '
+        'неизвестном типе тренировки и для пакета без данных.'
+    )
+    assert homework.process_batches({'XYZ': []}) == []
+
+
+def test_Training_type_name_override():
+    class Trail(homework.Running):
+        TRAINING_TYPE = 'TrailRunning'
+
+    class Sprint(homework.Running):
+        pass
+
+    assert Trail.TRAINING_TYPE == 'TrailRunning', (
+        'Подкласс должен иметь возможность задать своё название '
+        'тренировки через `TRAINING_TYPE`.'
+    )
+    assert Sprint.TRAINING_TYPE == 'Sprint'
+
+
+@pytest.mark.parametrize('training_type, row', [
+    ('Swimming', [720, 1, 80, 25, 40]),
+    ('Running', [15000, 1, 75]),
+    ('SportsWalking', [9000, 1.5, 75, 180]),
+])
+def test_describe_batch_subclass(training_type, row):
+    class Custom(getattr(homework, training_type)):
+        LEN_STEP = 0.8
+
+    assert Custom.describe_batch(*zip(row)) == [Custom(*row).describe()], (
+        'Метод `describe_batch` должен работать для подклассов '
+        'и учитывать их константы.'
+    )
+
+
+@pytest.mark.parametrize('training_type, row, expected', [
+    ('Running', [15000, 1, 75], 980.055),
+    ('SportsWalking', [9000, 1, 75, 180], 447.964),
+])
+def test_subclass_len_step_calories(training_type, row, expected):
+    class Custom(getattr(homework, training_type)):
+        LEN_STEP = 0.8
+
+    result = round(Custom(*row).get_spent_calories(), 3)
+    assert result == expected, (
+        'Коэффициенты формулы калорий должны пересчитываться '
+        'при переопределении `LEN_STEP` в подклассе.'
+    )
+
+
+def test_process_packages_matches_describe():
+    rnd = random.Random(20221015)
+    generators = {
+        'RUN': lambda: [rnd.randint(100, 30000), round(rnd.uniform(0.2, 5), 3),
+                        round(rnd.uniform(40, 120), 1)],
+        'WLK': lambda: [rnd.randint(100, 30000), round(rnd.uniform(0.2, 5), 3),
+                        round(rnd.uniform(40, 120), 1), rnd.randint(140, 200)],
+        'SWM': lambda: [rnd.randint(100, 20000), round(rnd.uniform(0.2, 5), 3),
+                        round(rnd.uniform(40, 120), 1), rnd.randint(20, 50),
+                        rnd.randint(1, 100)],
+    }
+    for workout_type, generate in generators.items():
+        packages = [(workout_type, generate()) for _ in range(3000)]
+        expected = [
+            homework.read_package(*package).describe() for package in packages
+        ]
+        assert homework.process_packages(packages) == expected, (
+            'Пакетная обработка должна давать те же сообщения, что и '
+            f'`describe` для каждой тренировки типа {workout_type}.'
+        )
+
+
+@pytest.mark.parametrize('batches', [
+    {'RUN': [[15000, 9000], [1], [75, 75]]},
+    {'RUN': [[15000], [1], [75, 75]]},
+    {'XYZ': [[1, 2], [3]]},
+])
+def test_process_batches_ragged_columns(batches):
+    with pytest.raises(ValueError):
+        homework.process_batches(batches)